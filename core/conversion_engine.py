@@ -1,11 +1,158 @@
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Tuple, Optional
 import math
+from array import array
 from enum import Enum, auto
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
 class BaseConversionError(Exception):
     """Custom exception for base conversion errors."""
     pass
 
+# Digit-value lookup table indexed by ASCII byte, covering 0-9, A-Z and
+# a-z. Invalid characters map to 0xFF so a single comparison against the
+# base validates each digit without the per-character int(ch, base) call.
+_DIGIT_LUT = bytearray([0xFF]) * 256
+for _value, _char in enumerate("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
+    _DIGIT_LUT[ord(_char)] = _DIGIT_LUT[ord(_char.lower())] = _value
+del _value, _char
+
+# Digit characters for bases up to 36, kept as bytes so encode loops can
+# append raw byte values into a bytearray
+_DIGITS = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# When True, the pure-Python encode loops map a digit value to its ASCII
+# byte arithmetically (one add) instead of indexing _DIGITS; which wins
+# depends on cache pressure, so the table stays selectable
+_DIGIT_CHAR_ARITHMETIC = True
+
+# Natural logs of the supported bases, indexed by base (entries 0 and 1
+# are padding so _LOG_BASE[base] works directly)
+_LOG_BASE = [0.0, 0.0] + [math.log(base) for base in range(2, 37)]
+_LN2 = math.log(2)
+
+# Largest digit count per base whose value is guaranteed to fit in a
+# signed 64-bit integer, the regime where the JIT-compiled kernels are
+# safe to use
+_INT64_SAFE_DIGITS = [0, 0] + [int(63 / math.log2(base)) for base in range(2, 37)]
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _horner_decode(buf, base, lut):
+    """
+    Horner-scheme decode kernel over a byte buffer.
+
+    Kept free of Python exceptions so it can be JIT-compiled: an invalid
+    byte is reported as -(index + 1) for the caller to diagnose.
+
+    Args:
+        buf (bytes): ASCII digit buffer
+        base (int): Base of the digits
+        lut (bytearray): Byte-indexed digit-value table
+
+    Returns:
+        int: Decoded value, or -(index + 1) of the first invalid byte
+    """
+    value = 0
+    for i in range(len(buf)):
+        digit = lut[buf[i]]
+        if digit >= base:
+            return -(i + 1)
+        value = value * base + digit
+    return value
+
+
+def _divmod_encode(value, base, out, digits):
+    """
+    Divmod encode kernel writing digit bytes least-significant first.
+
+    Args:
+        value (int): Non-negative value to encode
+        base (int): Target base
+        out (bytearray): Preallocated output buffer
+        digits (bytes): Digit alphabet
+
+    Returns:
+        int: Number of digit bytes written
+    """
+    count = 0
+    while value > 0:
+        digit = value % base
+        value = value // base
+        out[count] = digits[digit]
+        count += 1
+    return count
+
+
+if njit is not None:
+    _horner_decode = njit(cache=True)(_horner_decode)
+    _divmod_encode = njit(cache=True)(_divmod_encode)
+
+# SWAR constants for parsing eight ASCII decimal digits at once
+_SWAR_ZEROS = 0x3030303030303030
+_SWAR_NINES_GUARD = 0x4646464646464646
+_SWAR_MSB = 0x8080808080808080
+
+
+def _parse_u64_decimal(chunk: int) -> int:
+    """
+    Fold eight ASCII decimal digits (packed little-endian into a 64-bit
+    word) into their integer value using SWAR arithmetic.
+
+    Args:
+        chunk (int): Eight bytes read via int.from_bytes(..., 'little')
+
+    Returns:
+        int: The eight-digit value, or -1 if any byte is not '0'-'9'
+    """
+    if ((chunk + _SWAR_NINES_GUARD) | (chunk - _SWAR_ZEROS)) & _SWAR_MSB:
+        return -1
+    value = chunk - _SWAR_ZEROS
+    # Fold adjacent digits into pairs, pairs into quads, quads into the
+    # full eight-digit value: three multiplies instead of eight
+    value = (value * 2561) >> 8 & 0x00FF00FF00FF00FF
+    value = (value * 6553601) >> 16 & 0x0000FFFF0000FFFF
+    value = (value * 42949672960001) >> 32 & 0xFFFFFFFF
+    return value
+
+
+def _decode_decimal_swar(buf: bytes) -> int:
+    """
+    Decode an ASCII base-10 digit buffer, consuming eight digits per
+    iteration via _parse_u64_decimal and finishing any tail with the
+    lookup table.
+
+    Args:
+        buf (bytes): ASCII digit buffer
+
+    Returns:
+        int: Decoded integer value
+
+    Raises:
+        BaseConversionError: If the buffer contains a non-decimal digit
+    """
+    value = 0
+    index = 0
+    length = len(buf)
+    while length - index >= 8:
+        chunk = int.from_bytes(buf[index:index + 8], 'little')
+        folded = _parse_u64_decimal(chunk)
+        if folded < 0:
+            break  # invalid byte in this chunk; the tail loop diagnoses it
+        value = value * 100000000 + folded
+        index += 8
+    for byte in buf[index:]:
+        digit = _DIGIT_LUT[byte]
+        if digit >= 10:
+            raise BaseConversionError(
+                f"Invalid digit {chr(byte)!r} for base 10"
+            )
+        value = value * 10 + digit
+    return value
+
 class ConversionMode(Enum):
     """Enumeration of conversion modes for cognitive flexibility."""
     STANDARD = auto()
@@ -20,6 +167,20 @@ class CognitiveBaseConverter:
     tracking cognitive complexity and providing educational insights.
     """
 
+    # Digit-count threshold below which plain Horner / divmod loops beat the
+    # divide-and-conquer radix conversion on constant factors
+    _DNC_CUTOFF = 40
+
+    # Supported bases, hoisted so validation is two set-membership checks
+    _VALID_BASES = frozenset(range(2, 37))
+
+    # Ring-buffer capacity for conversion history; older entries are
+    # overwritten once the buffer is full
+    _HISTORY_CAPACITY = 4096
+
+    # Modes that record conversion history
+    _HISTORY_MODES = frozenset({ConversionMode.EDUCATIONAL, ConversionMode.STANDARD})
+
     def __init__(
         self,
         mode: ConversionMode = ConversionMode.STANDARD,
@@ -34,11 +195,27 @@ class CognitiveBaseConverter:
         """
         self.mode = mode
         self.max_bit_width = max_bit_width
-        self.conversion_history: List[Dict] = []
+        # Cached so the hot path tests one bool instead of two enum
+        # comparisons per call
+        self._record_history = mode in self._HISTORY_MODES
+        # Conversion history stored structure-of-arrays style in a bounded
+        # ring buffer: compact typed columns for the scalars, plain lists
+        # for the object-valued columns. Dicts are only materialized by
+        # get_conversion_history().
+        self._hist_src_base = array('b')
+        self._hist_tgt_base = array('b')
+        self._hist_complexity = array('d')
+        self._hist_value: List = []
+        self._hist_decimal: List = []
+        self._hist_repr: List[Optional[str]] = []
+        self._hist_head = 0
+        # Cache of base ** exponent values reused by the divide-and-conquer
+        # radix conversion, keyed by (base, exponent)
+        self._pow_cache: Dict[Tuple[int, int], int] = {}
 
     def convert(
         self,
-        value: Union[int, float],
+        value: Union[int, float, str],
         source_base: int,
         target_base: int
     ) -> Dict:
@@ -46,7 +223,7 @@ class CognitiveBaseConverter:
         Advanced base conversion with cognitive complexity tracking.
 
         Args:
-            value (Union[int, float]): Value to convert
+            value (Union[int, float, str]): Value to convert
             source_base (int): Source base (2-36)
             target_base (int): Target base (2-36)
 
@@ -56,11 +233,32 @@ class CognitiveBaseConverter:
         # Validate input bases
         self._validate_bases(source_base, target_base)
 
-        # Convert to decimal (intermediate representation)
+        # Convert to decimal (intermediate representation); this also
+        # validates the digits of the input
         decimal_value = self._to_decimal(value, source_base)
 
-        # Convert from decimal to target base
-        target_representation = self._from_decimal(decimal_value, target_base)
+        # Convert from decimal to target base, short-circuiting the
+        # trivial cases: identity conversions reuse the already-validated
+        # input digits, and integer results targeting base 10 come
+        # straight from str() (guarded against CPython's conversion limit
+        # for huge values)
+        if source_base == target_base:
+            target_representation = value if isinstance(value, str) else str(value)
+        elif (target_base == 10 and isinstance(decimal_value, int)
+                and decimal_value.bit_length() < 10000):
+            target_representation = str(decimal_value)
+        else:
+            target_representation = self._from_decimal(decimal_value, target_base)
+
+        # Performance mode skips complexity scoring and history tracking
+        if self.mode is ConversionMode.PERFORMANCE:
+            return {
+                "source_value": value,
+                "source_base": source_base,
+                "target_base": target_base,
+                "decimal_intermediate": decimal_value,
+                "target_representation": target_representation
+            }
 
         # Generate cognitive conversion metadata
         conversion_metadata = {
@@ -77,11 +275,96 @@ class CognitiveBaseConverter:
         }
 
         # Track conversion history if in educational mode
-        if self.mode in [ConversionMode.EDUCATIONAL, ConversionMode.STANDARD]:
-            self.conversion_history.append(conversion_metadata)
+        if self._record_history:
+            self._record_conversion(
+                source_base,
+                target_base,
+                conversion_metadata["cognitive_complexity"],
+                value,
+                decimal_value,
+                target_representation
+            )
 
         return conversion_metadata
 
+    def _record_conversion(
+        self,
+        source_base: int,
+        target_base: int,
+        complexity: float,
+        value,
+        decimal_value,
+        representation: Optional[str]
+    ) -> None:
+        """
+        Write one history row into the ring buffer.
+
+        A row with representation None marks a convert_many summary, with
+        the batch size stored in the value column.
+
+        Args:
+            source_base (int): Source base
+            target_base (int): Target base
+            complexity (float): Cognitive complexity score
+            value: Source value (or batch size for summary rows)
+            decimal_value: Decimal intermediate (None for summary rows)
+            representation (Optional[str]): Target representation
+        """
+        if len(self._hist_src_base) < self._HISTORY_CAPACITY:
+            self._hist_src_base.append(source_base)
+            self._hist_tgt_base.append(target_base)
+            self._hist_complexity.append(complexity)
+            self._hist_value.append(value)
+            self._hist_decimal.append(decimal_value)
+            self._hist_repr.append(representation)
+        else:
+            index = self._hist_head
+            self._hist_src_base[index] = source_base
+            self._hist_tgt_base[index] = target_base
+            self._hist_complexity[index] = complexity
+            self._hist_value[index] = value
+            self._hist_decimal[index] = decimal_value
+            self._hist_repr[index] = representation
+            self._hist_head = (index + 1) % self._HISTORY_CAPACITY
+
+    def convert_many(
+        self,
+        values: List[Union[int, float]],
+        source_base: int,
+        target_base: int
+    ) -> List[str]:
+        """
+        Convert a batch of values between the same pair of bases.
+
+        Bases are validated once and per-conversion metadata is skipped,
+        so the loop runs straight through the decode/encode kernels. A
+        single summary entry is recorded in history instead of one entry
+        per value.
+
+        Args:
+            values (List[Union[int, float]]): Values to convert
+            source_base (int): Source base (2-36)
+            target_base (int): Target base (2-36)
+
+        Returns:
+            List[str]: Target-base representations, in input order
+        """
+        self._validate_bases(source_base, target_base)
+
+        to_decimal = self._to_decimal
+        from_decimal = self._from_decimal
+        results = [
+            from_decimal(to_decimal(value, source_base), target_base)
+            for value in values
+        ]
+
+        if self._record_history:
+            self._record_conversion(
+                source_base, target_base, 0.0, len(results), None, None
+            )
+
+        return results
+
     def _validate_bases(self, source_base: int, target_base: int) -> None:
         """
         Validate base input constraints.
@@ -93,45 +376,246 @@ class CognitiveBaseConverter:
         Raises:
             BaseConversionError: For invalid base inputs
         """
-        valid_bases = range(2, 37)  # Standard base range
-        if source_base not in valid_bases or target_base not in valid_bases:
+        if source_base not in self._VALID_BASES or target_base not in self._VALID_BASES:
             raise BaseConversionError(
                 f"Bases must be between 2 and 36. "
                 f"Received: source_base={source_base}, target_base={target_base}"
             )
 
-    def _to_decimal(self, value: Union[int, float], source_base: int) -> float:
+    def _to_decimal(
+        self,
+        value: Union[int, float, str],
+        source_base: int
+    ) -> Union[int, float]:
         """
         Convert value from source base to decimal.
 
         Args:
-            value (Union[int, float]): Value to convert
+            value (Union[int, float, str]): Value to convert; strings allow
+                digit representations such as "1A.F3"
             source_base (int): Source base
 
         Returns:
-            float: Decimal representation
+            Union[int, float]: Decimal representation (exact int when the
+            value has no fractional part)
         """
+        # Native int/float inputs in base 10 are already decimal; skip the
+        # format-and-reparse round trip entirely. Negatives are rejected
+        # here just as the digit-string path rejects a '-' sign, so they
+        # never reach the encode loops, which assume non-negative input
+        if source_base == 10 and not isinstance(value, str):
+            if value < 0:
+                raise BaseConversionError(
+                    f"Negative values are not supported: {value!r}"
+                )
+            return value
+
         # Handle integer and fractional parts separately
-        str_value = str(value)
+        str_value = value if isinstance(value, str) else str(value)
 
         # Split integer and fractional parts
         parts = str_value.split('.')
         integer_part = parts[0]
         fractional_part = parts[1] if len(parts) > 1 else ''
 
-        # Convert integer part
-        integer_decimal = sum(
-            int(digit, source_base) * (source_base ** power)
-            for power, digit in enumerate(reversed(integer_part))
+        # Convert integer part (divide-and-conquer for long digit strings,
+        # Horner's scheme below the cutoff)
+        integer_decimal = self._decode_int(integer_part, source_base)
+
+        # Convert fractional part the same way, scaling back with a single
+        # cached power at the end. Pure integers stay exact (no float
+        # round-off), which matters for long digit strings.
+        if not fractional_part:
+            return integer_decimal
+
+        fractional_numerator = self._decode_int(fractional_part, source_base)
+        return integer_decimal + (
+            fractional_numerator / self._cached_pow(source_base, len(fractional_part))
         )
 
-        # Convert fractional part
-        fractional_decimal = sum(
-            int(digit, source_base) * (source_base ** -(power + 1))
-            for power, digit in enumerate(fractional_part)
-        ) if fractional_part else 0.0
+    def _cached_pow(self, base: int, exponent: int) -> int:
+        """
+        Return base ** exponent, memoized across conversions.
+
+        Args:
+            base (int): Base of the power
+            exponent (int): Non-negative exponent
+
+        Returns:
+            int: base raised to exponent
+        """
+        key = (base, exponent)
+        value = self._pow_cache.get(key)
+        if value is None:
+            value = base ** exponent
+            self._pow_cache[key] = value
+        return value
+
+    def _decode_int(self, digits_str: str, base: int) -> int:
+        """
+        Decode a digit string into an integer.
 
-        return integer_decimal + fractional_decimal
+        Uses Schönhage-style divide-and-conquer for long strings, which is
+        O(M(n) log n) instead of the O(n^2) cost of digit-by-digit
+        accumulation; short strings use Horner's scheme where the quadratic
+        method wins on constants.
+
+        Args:
+            digits_str (str): Digit string in the given base
+            base (int): Base of the digit string
+
+        Returns:
+            int: Decoded integer value
+        """
+        length = len(digits_str)
+        if length <= self._DNC_CUTOFF:
+            try:
+                buf = digits_str.encode('ascii')
+            except UnicodeEncodeError:
+                raise BaseConversionError(
+                    f"Invalid digit string {digits_str!r} for base {base}"
+                )
+            if base == 10 and length >= 8:
+                return _decode_decimal_swar(buf)
+            if length <= _INT64_SAFE_DIGITS[base]:
+                value = _horner_decode(buf, base, _DIGIT_LUT)
+                if value < 0:
+                    byte = buf[-value - 1]
+                    raise BaseConversionError(
+                        f"Invalid digit {chr(byte)!r} for base {base}"
+                    )
+                return value
+            value = 0
+            for byte in buf:
+                digit = _DIGIT_LUT[byte]
+                if digit >= base:
+                    raise BaseConversionError(
+                        f"Invalid digit {chr(byte)!r} for base {base}"
+                    )
+                value = value * base + digit
+            return value
+
+        mid = length // 2
+        high = self._decode_int(digits_str[:mid], base)
+        low = self._decode_int(digits_str[mid:], base)
+        return high * self._cached_pow(base, length - mid) + low
+
+    def _encode_int(self, value: int, base: int) -> str:
+        """
+        Encode a non-negative integer as a digit string in the given base.
+
+        Mirrors _decode_int: large values are split recursively at a cached
+        power of the base, small values use the plain divmod loop.
+
+        Args:
+            value (int): Non-negative integer to encode
+            base (int): Target base
+
+        Returns:
+            str: Digit string without leading zeros ('0' for zero)
+        """
+        if value < self._cached_pow(base, self._DNC_CUTOFF):
+            return self._encode_leaf(value, base)
+
+        # Grow the split exponent in powers of two so the recursion halves
+        # the digit count at each level
+        exponent = self._DNC_CUTOFF
+        while self._cached_pow(base, 2 * exponent) <= value:
+            exponent *= 2
+        quotient, remainder = divmod(value, self._cached_pow(base, exponent))
+        return (
+            self._encode_int(quotient, base)
+            + self._encode_int_padded(remainder, base, exponent)
+        )
+
+    # Lazily built per-base tables mapping a 4-digit block value to its
+    # digit bytes (least-significant first), shared across instances.
+    # Restricted to small bases so no table exceeds 16**4 entries.
+    _BLOCK_TABLES: Dict[int, List[bytes]] = {}
+    _BLOCK_TABLE_MAX_BASE = 16
+
+    @classmethod
+    def _block_table(cls, base: int) -> List[bytes]:
+        """
+        Return (building on first use) the 4-digit block table for a base.
+
+        Args:
+            base (int): Target base, at most _BLOCK_TABLE_MAX_BASE
+
+        Returns:
+            List[bytes]: Entry i holds the four digit bytes of i,
+            least-significant first
+        """
+        table = cls._BLOCK_TABLES.get(base)
+        if table is None:
+            table = []
+            for block_value in range(base ** 4):
+                chunk = bytearray(4)
+                for position in range(4):
+                    block_value, digit = divmod(block_value, base)
+                    chunk[position] = _DIGITS[digit]
+                table.append(bytes(chunk))
+            cls._BLOCK_TABLES[base] = table
+        return table
+
+    def _encode_leaf(self, value: int, base: int) -> str:
+        """
+        Encode a below-cutoff value as a digit string, no leading zeros.
+
+        Values within int64 range go through the divmod kernel; larger
+        values emit four digits per division using the block table when
+        the base permits one.
+
+        Args:
+            value (int): Non-negative integer to encode
+            base (int): Target base
+
+        Returns:
+            str: Digit string ('0' for zero)
+        """
+        encoded = bytearray()
+        if value > _INT64_MAX and base <= self._BLOCK_TABLE_MAX_BASE:
+            table = self._block_table(base)
+            block = self._cached_pow(base, 4)
+            while value > _INT64_MAX:
+                value, remainder = divmod(value, block)
+                encoded.extend(table[remainder])
+        if value <= _INT64_MAX:
+            out = bytearray(64)
+            count = _divmod_encode(value, base, out, _DIGITS)
+            encoded.extend(out[:count])
+        elif _DIGIT_CHAR_ARITHMETIC:
+            while value > 0:
+                value, remainder = divmod(value, base)
+                encoded.append(remainder + 48 if remainder < 10 else remainder + 55)
+        else:
+            while value > 0:
+                value, remainder = divmod(value, base)
+                encoded.append(_DIGITS[remainder])
+        encoded.reverse()
+        return encoded.decode('ascii') or '0'
+
+    def _encode_int_padded(self, value: int, base: int, width: int) -> str:
+        """
+        Encode value in the given base, zero-padded to exactly width digits.
+
+        Args:
+            value (int): Non-negative integer to encode
+            base (int): Target base
+            width (int): Exact number of digits to emit
+
+        Returns:
+            str: Zero-padded digit string
+        """
+        if width <= self._DNC_CUTOFF:
+            return self._encode_leaf(value, base).rjust(width, '0')
+
+        half = width // 2
+        quotient, remainder = divmod(value, self._cached_pow(base, half))
+        return (
+            self._encode_int_padded(quotient, base, width - half)
+            + self._encode_int_padded(remainder, base, half)
+        )
 
     def _from_decimal(self, value: float, target_base: int) -> str:
         """
@@ -148,28 +632,31 @@ class CognitiveBaseConverter:
         integer_part = int(value)
         fractional_part = value - integer_part
 
-        # Convert integer part
-        digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        integer_conversion = []
+        # Convert integer part (divide-and-conquer for large values)
+        result = self._encode_int(integer_part, target_base)
 
-        while integer_part > 0:
-            integer_conversion.insert(0, digits[integer_part % target_base])
-            integer_part //= target_base
-
-        # Convert fractional part
-        fractional_conversion = []
+        # Convert fractional part: scale once to an integer and emit digits
+        # with divmod, so the loop runs in exact integer arithmetic instead
+        # of accumulating float error
+        fractional_conversion = bytearray()
         precision = 10  # Number of fractional digits
 
-        while fractional_part > 0 and len(fractional_conversion) < precision:
-            fractional_part *= target_base
-            digit = int(fractional_part)
-            fractional_conversion.append(digits[digit])
-            fractional_part -= digit
+        if fractional_part > 0:
+            scale = self._cached_pow(target_base, precision)
+            numerator = int(fractional_part * scale)
+            if _DIGIT_CHAR_ARITHMETIC:
+                while numerator > 0 and len(fractional_conversion) < precision:
+                    scale //= target_base
+                    digit, numerator = divmod(numerator, scale)
+                    fractional_conversion.append(digit + 48 if digit < 10 else digit + 55)
+            else:
+                while numerator > 0 and len(fractional_conversion) < precision:
+                    scale //= target_base
+                    digit, numerator = divmod(numerator, scale)
+                    fractional_conversion.append(_DIGITS[digit])
 
-        # Combine parts
-        result = ''.join(integer_conversion or ['0'])
         if fractional_conversion:
-            result += '.' + ''.join(fractional_conversion)
+            result += '.' + fractional_conversion.decode('ascii')
 
         return result
 
@@ -191,13 +678,20 @@ class CognitiveBaseConverter:
             float: Cognitive complexity score
         """
         base_difference = abs(source_base - target_base)
-        value_magnitude = abs(value)
 
-        # Complexity is a function of base difference and value magnitude
+        # Magnitude term: integers get their log from bit_length (a cheap
+        # C-level count) instead of a libm call; floats keep log1p
+        if isinstance(value, int):
+            log_magnitude = abs(value).bit_length() * _LN2
+        else:
+            log_magnitude = math.log1p(abs(value))
+
+        # Complexity is a function of base difference and value magnitude;
+        # the base log comes from the precomputed table
         complexity = (
             base_difference *
-            (1 + math.log(value_magnitude + 1)) /
-            math.log(max(source_base, target_base))
+            (1 + log_magnitude) /
+            _LOG_BASE[max(source_base, target_base)]
         )
 
         return min(complexity, 10.0)  # Cap complexity at 10
@@ -206,14 +700,44 @@ class CognitiveBaseConverter:
         """
         Retrieve conversion history for analysis.
 
+        Materializes metadata dicts on demand from the ring-buffer
+        columns, oldest entry first.
+
         Returns:
             List[Dict]: Historical conversion metadata
         """
-        return self.conversion_history
+        count = len(self._hist_src_base)
+        start = self._hist_head
+        history = []
+        for offset in range(count):
+            index = (start + offset) % count
+            representation = self._hist_repr[index]
+            if representation is None:
+                history.append({
+                    "batch_size": self._hist_value[index],
+                    "source_base": self._hist_src_base[index],
+                    "target_base": self._hist_tgt_base[index]
+                })
+            else:
+                history.append({
+                    "source_value": self._hist_value[index],
+                    "source_base": self._hist_src_base[index],
+                    "target_base": self._hist_tgt_base[index],
+                    "decimal_intermediate": self._hist_decimal[index],
+                    "target_representation": representation,
+                    "cognitive_complexity": self._hist_complexity[index]
+                })
+        return history
 
     def reset_conversion_history(self) -> None:
         """Reset conversion history tracking."""
-        self.conversion_history = []
+        del self._hist_src_base[:]
+        del self._hist_tgt_base[:]
+        del self._hist_complexity[:]
+        self._hist_value.clear()
+        self._hist_decimal.clear()
+        self._hist_repr.clear()
+        self._hist_head = 0
 
 def convert_number(value: Union[int, float], source_base: int, target_base: int) -> Union[int, float]:
     """
@@ -237,6 +761,27 @@ def convert_number(value: Union[int, float], source_base: int, target_base: int)
     else:
         raise ValueError("Value must be an integer or float.")
 
+def convert_number_batch(
+    values: List[Union[int, float]],
+    source_bases: List[int],
+    target_bases: List[int]
+) -> List[Union[int, float, str]]:
+    """
+    Converts a batch of numbers in a single call.
+
+    Args:
+        values (List[Union[int, float]]): The numbers to convert.
+        source_bases (List[int]): Base of each input number.
+        target_bases (List[int]): Base to convert each number to.
+
+    Returns:
+        List[Union[int, float, str]]: One converted value per input triple.
+    """
+    return [
+        convert_number(value, source_base, target_base)
+        for value, source_base, target_base in zip(values, source_bases, target_bases)
+    ]
+
 def _convert_int_to_base(value: int, source_base: int, target_base: int) -> str:
     """
     Converts an integer from source_base to target_base.
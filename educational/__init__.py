@@ -1,3 +1,3 @@
-from .learning_pathways import LearningState, AdaptiveLearningPathway, DifficultyLevel
+from .learning_pathways import LearningState, AdaptiveLearningPathway, Challenge, DifficultyLevel
 
-__all__ = ['LearningState', 'AdaptiveLearningPathway', 'DifficultyLevel']
\ No newline at end of file
+__all__ = ['LearningState', 'AdaptiveLearningPathway', 'Challenge', 'DifficultyLevel']
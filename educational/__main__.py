@@ -0,0 +1,16 @@
+import os
+import unittest
+
+# Single entry point for the package's tests (python -m educational):
+# one interpreter startup and one import pass cover every discovered
+# test module, instead of each file running unittest.main itself.
+
+
+def main() -> int:
+    suite = unittest.defaultTestLoader.discover(os.path.dirname(os.path.abspath(__file__)))
+    result = unittest.TextTestRunner().run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
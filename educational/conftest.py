@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+# Make the repo root importable exactly once, no matter where the
+# runner was started from
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_working_dir(tmp_path, monkeypatch):
+    """
+    Run each test in its own temporary directory.
+
+    LearningPathways opens its SQLite file relative to the working
+    directory, so this keeps tests from sharing database state and lets
+    pytest-xdist workers run concurrently without racing on one file.
+    """
+    monkeypatch.chdir(tmp_path)
@@ -1,7 +1,17 @@
 import argparse
+import functools
+import json
+import os
+import pickle
+import shlex
 import sys
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional, faster serializer
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Use absolute imports
@@ -11,7 +21,9 @@ from educational.learning_pathways import (
     DifficultyLevel,
 )
 
-def main():
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the argument parser once and reuse it on later calls."""
     parser = argparse.ArgumentParser(
         description="Learning Pathways CLI"
     )
@@ -86,19 +98,21 @@ def main():
     delete_parser = subparsers.add_parser("delete", help="Delete a learning pathway")
     delete_parser.add_argument("name", help="Name of the learning pathway to delete")
 
-    args = parser.parse_args()
+    # Add the 'serve' command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run commands from stdin in one long-lived process"
+    )
 
-    # Initialize learning state
-    learning_state = LearningState()
-    learning_pathway = AdaptiveLearningPathway(initial_state=learning_state)
+    return parser
 
-    # Import LearningPathways here
-    from educational.learning_pathways import LearningPathways
-    pathways = LearningPathways()
+def _dispatch(args, parser, learning_state, learning_pathway, pathways) -> bool:
+    """
+    Execute one parsed command.
 
-    # -----------------------------
-    # Route command logic
-    # -----------------------------
+    Returns:
+        bool: True if the learning state was mutated and should be saved
+    """
     if args.command == 'start':
         print("\n=== Starting a new learning session ===")
         # Optionally, set initial difficulty here
@@ -112,13 +126,15 @@ def main():
             valid_levels = [level.name.lower() for level in DifficultyLevel]
             print(f"Error: Invalid challenge level '{args.challenge_level}'.")
             print(f"Must be one of: {valid_levels}")
-            return
+            return False
 
-        # Create a challenge result
+        # Create a challenge result; store the level by name so the
+        # persisted state stays serializable with the stdlib json
+        # fallback (and identical to what orjson would write)
         result = {
             'solving_time': args.solving_time,
             'error_rate': args.error_rate,
-            'challenge': challenge_enum
+            'challenge': challenge_enum.name
         }
 
         # Submit the challenge result
@@ -128,6 +144,7 @@ def main():
         print(f"  Error Rate: {args.error_rate}")
         print(f"  Challenge Level: {challenge_enum.name}")
         print(f"New difficulty level: {learning_state.difficulty_level.name}")
+        return True
 
     elif args.command == 'state':
         print("\n=== Current Learning State ===")
@@ -175,23 +192,108 @@ def main():
         # If no valid command is provided
         parser.print_help()
 
+    # Read-only commands never require a state save
+    return False
+
+def _serve(parser, learning_state, learning_pathway, pathways):
+    """
+    Loop over commands read from stdin, reusing the in-memory state.
+
+    The learning state is parsed once at startup and persisted only
+    after commands that mutate it, so repeated commands skip the
+    per-invocation load/parse/serialize cycle entirely. An empty line is
+    ignored; 'quit' or 'exit' ends the loop.
+    """
+    for line in sys.stdin:
+        try:
+            argv = shlex.split(line)
+        except ValueError:
+            # Unbalanced quoting; like bad arguments below, skip the
+            # line rather than killing the loop
+            continue
+        if not argv:
+            continue
+        if argv[0] in ('quit', 'exit'):
+            break
+        try:
+            args = parser.parse_args(argv)
+        except SystemExit:
+            # argparse rejects bad input by exiting; stay alive instead
+            continue
+        if args.command == 'serve':
+            continue
+        if _dispatch(args, parser, learning_state, learning_pathway, pathways):
+            save_learning_state(learning_state)
+
+def main():
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    # Initialize learning state from disk
+    learning_state = load_learning_state()
+    learning_pathway = AdaptiveLearningPathway(initial_state=learning_state)
+
+    # Import LearningPathways here
+    from educational.learning_pathways import LearningPathways
+    pathways = LearningPathways()
+
+    if args.command == 'serve':
+        _serve(parser, learning_state, learning_pathway, pathways)
+        return
+
+    if _dispatch(args, parser, learning_state, learning_pathway, pathways):
+        save_learning_state(learning_state)
+
+STATE_FILE = 'learning_state.json'
+STATE_PICKLE = 'learning_state.pkl'
+
 def load_learning_state():
-    import json
-    import os
-    STATE_FILE = 'learning_state.json'
+    # Prefer the pickle sidecar when it is at least as fresh as the JSON
+    # file; unpickling skips the dict round-trip entirely
+    try:
+        pickle_mtime = os.path.getmtime(STATE_PICKLE)
+    except OSError:
+        pickle_mtime = None
+
+    if pickle_mtime is not None:
+        try:
+            json_mtime = os.path.getmtime(STATE_FILE)
+        except OSError:
+            json_mtime = None
+        if json_mtime is None or pickle_mtime >= json_mtime:
+            try:
+                with open(STATE_PICKLE, 'rb') as f:
+                    return pickle.load(f)
+            except Exception:
+                # Stale, truncated, or corrupt sidecar (unpickling
+                # garbage can raise nearly anything: EOFError,
+                # UnpicklingError, ImportError, ...); fall through to
+                # JSON rather than crashing every startup
+                pass
 
     if os.path.exists(STATE_FILE):
-        with open(STATE_FILE, 'r') as f:
-            state_data = json.load(f)
-            return LearningState.from_dict(state_data)
+        with open(STATE_FILE, 'rb') as f:
+            raw = f.read()
+        state_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return LearningState.from_dict(state_data)
     else:
         return LearningState()
 
+def _write_atomic(path, data):
+    # Write to a sidecar and replace atomically so a crash mid-write
+    # cannot truncate the existing file
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, path)
+
 def save_learning_state(state):
-    import json
-    STATE_FILE = 'learning_state.json'
-    with open(STATE_FILE, 'w') as f:
-        json.dump(state.to_dict(), f)
+    if orjson is not None:
+        data = orjson.dumps(state.to_dict())
+    else:
+        data = json.dumps(state.to_dict()).encode('utf-8')
+    _write_atomic(STATE_FILE, data)
+    _write_atomic(STATE_PICKLE, pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,14 +1,59 @@
-from typing import List, Dict, Union, Optional
+from typing import Deque, List, Dict, NamedTuple, Union, Optional
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import random
 import math
-import json
-import os
-import sqlite3
-import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+try:
+    from numba import njit
+except ImportError:  # numba is an optional accelerator
+    njit = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, used for batched generation
+    np = None
+
+# sqlite3 and logging are imported lazily in LearningPathways.__init__;
+# the in-memory learning types above need neither, and skipping them
+# keeps package import light for CLI startup and test collection
+_logger = None
+
+# Natural logs of every valid base (2..36), indexed by base so the
+# complexity kernel replaces a transcendental call with a tuple index;
+# entries below 2 are padding and never read
+_LOG_TABLE = tuple(math.log(i) if i >= 2 else 0.0 for i in range(37))
+
+
+def _complexity_kernel(source_base: int, target_base: int, value: float) -> float:
+    """
+    Cognitive-complexity kernel shared by challenge generation.
+
+    Kept as a free function over scalars so it can be JIT-compiled when
+    numba is available.
+
+    Args:
+        source_base (int): Source base
+        target_base (int): Target base
+        value (float): Challenge value
+
+    Returns:
+        float: Cognitive complexity score, capped at 10.0
+    """
+    base_difference = abs(source_base - target_base)
+    complexity = (
+        base_difference *
+        (1.0 + math.log(abs(value) + 1.0)) /
+        _LOG_TABLE[max(source_base, target_base)]
+    )
+    return min(complexity, 10.0)
+
+
+if njit is not None:
+    _complexity_kernel = njit(cache=True, fastmath=True)(_complexity_kernel)
+    _complexity_kernel(10, 2, 1.0)  # warm the compile cache at import
 
 class DifficultyLevel(Enum):
     """
@@ -19,18 +64,80 @@ class DifficultyLevel(Enum):
     ADVANCED = auto()
     EXPERT = auto()
 
-@dataclass
+# Difficulty transitions, indexed by DifficultyLevel.value - 1 so a step
+# is a single tuple index instead of a dict built per call
+_NEXT_DIFFICULTY = (
+    DifficultyLevel.INTERMEDIATE,
+    DifficultyLevel.ADVANCED,
+    DifficultyLevel.EXPERT,
+    DifficultyLevel.EXPERT
+)
+_PREV_DIFFICULTY = (
+    DifficultyLevel.BEGINNER,
+    DifficultyLevel.BEGINNER,
+    DifficultyLevel.INTERMEDIATE,
+    DifficultyLevel.ADVANCED
+)
+
+# Challenge-generation ranges per difficulty level, indexed by
+# DifficultyLevel.value - 1 (BEGINNER, INTERMEDIATE, ADVANCED, EXPERT)
+_BASE_RANGE = ((2, 10), (2, 16), (2, 36), (2, 36))
+_VALUE_RANGE = ((0, 100), (0, 1000), (0, 10000), (0, 1000000))
+
+
+class Challenge(NamedTuple):
+    """
+    A generated conversion challenge.
+
+    Tuple-packed with a fixed layout, so creating one is a single
+    PyTupleObject allocation instead of a five-entry dict; fields are
+    accessed as attributes.
+    """
+    source_base: int
+    target_base: int
+    value: Union[int, float]
+    difficulty_level: str
+    cognitive_complexity: float
+
+    def as_dict(self) -> Dict:
+        """Return the challenge as a plain dict (for serialization or
+        callers that expect the old mapping shape)."""
+        return self._asdict()
+
+@dataclass(slots=True)
 class LearningState:
     """
     Represents a learner's cognitive state and progression.
     """
+    # Cap on retained challenge history so long sessions hold steady-state
+    # memory instead of growing linearly
+    _HISTORY_CAP = 10000
+
     difficulty_level: DifficultyLevel = DifficultyLevel.BEGINNER
-    completed_challenges: List[Dict] = field(default_factory=list)
+    completed_challenges: Deque[Dict] = field(
+        default_factory=lambda: deque(maxlen=LearningState._HISTORY_CAP)
+    )
     cognitive_profile: Dict = field(default_factory=dict)
 
-    # Cognitive tracking metrics
-    time_to_solve: List[float] = field(default_factory=list)
-    error_rates: List[float] = field(default_factory=list)
+    # Cognitive tracking metrics: typed arrays store doubles contiguously
+    # instead of one heap-allocated float object per sample
+    time_to_solve: array = field(default_factory=lambda: array('d'))
+    error_rates: array = field(default_factory=lambda: array('d'))
+
+    # Bounded window over the most recent metrics, kept alongside running
+    # sums so the rolling means used by difficulty adjustment are O(1)
+    # regardless of how long the session runs
+    _RECENT_WINDOW = 5
+    _recent_times: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=LearningState._RECENT_WINDOW),
+        init=False, repr=False
+    )
+    _recent_errors: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=LearningState._RECENT_WINDOW),
+        init=False, repr=False
+    )
+    _recent_time_sum: float = field(default=0.0, init=False, repr=False)
+    _recent_error_sum: float = field(default=0.0, init=False, repr=False)
 
     def update_profile(self, challenge_result: Dict) -> None:
         """
@@ -41,11 +148,24 @@ class LearningState:
         """
         self.completed_challenges.append(challenge_result)
 
+        solving_time = challenge_result.get('solving_time', 0)
+        error_rate = challenge_result.get('error_rate', 0)
+
         # Track solving time
-        self.time_to_solve.append(challenge_result.get('solving_time', 0))
+        self.time_to_solve.append(solving_time)
 
         # Track error rates
-        self.error_rates.append(challenge_result.get('error_rate', 0))
+        self.error_rates.append(error_rate)
+
+        # Maintain the rolling window, evicting the oldest sample from the
+        # running sums once the window is full
+        if len(self._recent_times) == self._RECENT_WINDOW:
+            self._recent_time_sum -= self._recent_times[0]
+            self._recent_error_sum -= self._recent_errors[0]
+        self._recent_times.append(solving_time)
+        self._recent_errors.append(error_rate)
+        self._recent_time_sum += solving_time
+        self._recent_error_sum += error_rate
 
         # Dynamically adjust difficulty
         self._adjust_difficulty()
@@ -55,58 +175,48 @@ class LearningState:
         Dynamically adjust difficulty based on cognitive performance.
         """
         # If no data points, do nothing
-        if not self.time_to_solve or not self.error_rates:
+        sample_count = len(self._recent_times)
+        if sample_count == 0:
             return
 
-        # Get the most recent performance metrics
-        current_solving_time = self.time_to_solve[-1]
-        current_error_rate = self.error_rates[-1]
+        # Rolling means over the recent window, computed from the running
+        # sums without walking the history
+        mean_solving_time = self._recent_time_sum / sample_count
+        mean_error_rate = self._recent_error_sum / sample_count
 
         # Cognitive complexity heuristics
-        if current_solving_time < 30 and current_error_rate < 0.1:
+        if mean_solving_time < 30 and mean_error_rate < 0.1:
             self._increase_difficulty()
-        elif current_solving_time > 120 or current_error_rate > 0.3:
+        elif mean_solving_time > 120 or mean_error_rate > 0.3:
             # For poor performance, always return to BEGINNER
             self.difficulty_level = DifficultyLevel.BEGINNER
             # Clear performance metrics to start fresh
-            self.time_to_solve.clear()
-            self.error_rates.clear()
+            del self.time_to_solve[:]
+            del self.error_rates[:]
+            self._recent_times.clear()
+            self._recent_errors.clear()
+            self._recent_time_sum = 0.0
+            self._recent_error_sum = 0.0
 
     def _increase_difficulty(self) -> None:
         """Increase cognitive challenge level."""
-        difficulty_mapping = {
-            DifficultyLevel.BEGINNER: DifficultyLevel.INTERMEDIATE,
-            DifficultyLevel.INTERMEDIATE: DifficultyLevel.ADVANCED,
-            DifficultyLevel.ADVANCED: DifficultyLevel.EXPERT
-        }
-        self.difficulty_level = difficulty_mapping.get(
-            self.difficulty_level,
-            DifficultyLevel.EXPERT
-        )
+        self.difficulty_level = _NEXT_DIFFICULTY[self.difficulty_level.value - 1]
 
     def _decrease_difficulty(self) -> None:
         """Decrease cognitive challenge level."""
-        difficulty_mapping = {
-            DifficultyLevel.EXPERT: DifficultyLevel.ADVANCED,
-            DifficultyLevel.ADVANCED: DifficultyLevel.INTERMEDIATE,
-            DifficultyLevel.INTERMEDIATE: DifficultyLevel.BEGINNER
-        }
-        self.difficulty_level = difficulty_mapping.get(
-            self.difficulty_level,
-            DifficultyLevel.BEGINNER
-        )
+        self.difficulty_level = _PREV_DIFFICULTY[self.difficulty_level.value - 1]
 
     def to_dict(self):
         return {
             'difficulty_level': self.difficulty_level.name,
-            'completed_challenges': self.completed_challenges,
+            'completed_challenges': list(self.completed_challenges),
             # Include other relevant attributes if needed
         }
 
     @classmethod
     def from_dict(cls, data):
         difficulty_level = DifficultyLevel[data['difficulty_level'].upper()]
-        completed_challenges = data['completed_challenges']
+        completed_challenges = deque(data['completed_challenges'], maxlen=cls._HISTORY_CAP)
         # Initialize other attributes as needed
         return cls(difficulty_level=difficulty_level, completed_challenges=completed_challenges)
 
@@ -119,7 +229,8 @@ class AdaptiveLearningPathway:
         self,
         initial_state: Optional[LearningState] = None,
         min_base: int = 2,
-        max_base: int = 36
+        max_base: int = 36,
+        seed: Optional[int] = None
     ):
         """
         Initialize adaptive learning pathway.
@@ -128,68 +239,137 @@ class AdaptiveLearningPathway:
             initial_state (Optional[LearningState]): Starting learner state
             min_base (int): Minimum base for challenges
             max_base (int): Maximum base for challenges
+            seed (Optional[int]): Seed for deterministic challenge
+                generation (useful for reproducible benchmarks)
         """
         self.learning_state = initial_state or LearningState()
         self.min_base = min_base
         self.max_base = max_base
+        # Dedicated generator with its methods bound once: randrange is
+        # the underlying implementation randint wraps, and binding skips
+        # the module attribute lookup per draw
+        self._rng = random.Random(seed)
+        self._randrange = self._rng.randrange
+        self._random = self._rng.random
+        self._np_rng = np.random.default_rng(seed) if np is not None else None
+        # One specialized generator per difficulty level; switching
+        # difficulty is then a plain dict lookup with no re-specialization
+        self._gen_fns = {level: self._make_gen(level) for level in DifficultyLevel}
+
+    def _make_gen(self, level: DifficultyLevel):
+        """
+        Build a challenge generator specialized for one difficulty level.
+
+        The per-level constants (base and value ranges, fractional
+        eligibility, level name) are baked into the closure's cells, so
+        each call skips the range lookups and eligibility branch a
+        generic generator would re-evaluate.
 
-    def generate_challenge(self) -> Dict:
+        Args:
+            level (DifficultyLevel): Level to specialize for
+
+        Returns:
+            Callable[[], Challenge]: Zero-argument challenge generator
+        """
+        level_index = level.value - 1
+        min_base, max_base = _BASE_RANGE[level_index]
+        min_value, max_value = _VALUE_RANGE[level_index]
+        # Fractional values only appear at higher difficulties
+        allow_fractional = level in (DifficultyLevel.ADVANCED, DifficultyLevel.EXPERT)
+        level_name = level.name
+        randrange = self._randrange
+        rand = self._random
+        complexity = self._calculate_challenge_complexity
+
+        def generate() -> Challenge:
+            source_base = randrange(min_base, max_base + 1)
+            target_base = randrange(min_base, max_base + 1)
+
+            if allow_fractional and rand() < 0.3:
+                value = randrange(min_value, max_value + 1) + round(rand(), 3)
+            else:
+                value = randrange(min_value, max_value + 1)
+
+            return Challenge(
+                source_base,
+                target_base,
+                value,
+                level_name,
+                complexity(source_base, target_base, value)
+            )
+
+        return generate
+
+    def generate_challenge(self) -> Challenge:
         """
         Generate a personalized number conversion challenge.
 
+        Dispatches to the generator specialized for the current
+        difficulty level, precomputed in __init__.
+
         Returns:
-            Dict: Challenge specification with cognitive complexity metrics
+            Challenge: Challenge record with cognitive complexity metrics
         """
-        # Dynamically select bases based on difficulty
-        base_complexity_map = {
-            DifficultyLevel.BEGINNER: (2, 10),
-            DifficultyLevel.INTERMEDIATE: (2, 16),
-            DifficultyLevel.ADVANCED: (2, 36),
-            DifficultyLevel.EXPERT: (2, 36)
-        }
+        return self._gen_fns[self.learning_state.difficulty_level]()
 
-        min_base, max_base = base_complexity_map[self.learning_state.difficulty_level]
+    def generate_challenges(self, count: int) -> List[Challenge]:
+        """
+        Generate a batch of personalized challenges in one call.
 
-        source_base = random.randint(min_base, max_base)
-        target_base = random.randint(min_base, max_base)
+        When numpy is available, every random draw and the complexity
+        scores are computed in single vectorized passes, avoiding the
+        per-call Python overhead of generate_challenge; Challenge records
+        are only materialized at the boundary. Without numpy this simply
+        loops.
 
-        # Generate challenge value with complexity based on difficulty
-        value_complexity = {
-            DifficultyLevel.BEGINNER: (0, 100),
-            DifficultyLevel.INTERMEDIATE: (0, 1000),
-            DifficultyLevel.ADVANCED: (0, 10000),
-            DifficultyLevel.EXPERT: (0, 1000000)
-        }
+        Args:
+            count (int): Number of challenges to generate
 
-        min_value, max_value = value_complexity[self.learning_state.difficulty_level]
+        Returns:
+            List[Challenge]: Challenge records, same shape as
+            generate_challenge
+        """
+        if np is None:
+            return [self.generate_challenge() for _ in range(count)]
 
-        # Include possibility of fractional values at higher difficulties
-        is_fractional = (
-            self.learning_state.difficulty_level in
-            [DifficultyLevel.ADVANCED, DifficultyLevel.EXPERT]
-        ) and random.random() < 0.3
+        level = self.learning_state.difficulty_level
 
-        if is_fractional:
-            integer_part = random.randint(min_value, max_value)
-            fractional_part = round(random.random(), 3)
-            value = integer_part + fractional_part
-        else:
-            value = random.randint(min_value, max_value)
-
-        # Generate cognitive complexity metrics
-        challenge = {
-            "source_base": source_base,
-            "target_base": target_base,
-            "value": value,
-            "difficulty_level": self.learning_state.difficulty_level.name,
-            "cognitive_complexity": self._calculate_challenge_complexity(
-                source_base,
-                target_base,
-                value
+        min_base, max_base = _BASE_RANGE[level.value - 1]
+        min_value, max_value = _VALUE_RANGE[level.value - 1]
+        allow_fractional = level in [DifficultyLevel.ADVANCED, DifficultyLevel.EXPERT]
+
+        rng = self._np_rng
+        source_bases = rng.integers(min_base, max_base + 1, size=count)
+        target_bases = rng.integers(min_base, max_base + 1, size=count)
+        values = rng.integers(min_value, max_value + 1, size=count).astype(np.float64)
+
+        if allow_fractional:
+            fractional_mask = rng.random(count) < 0.3
+            values = values + np.where(
+                fractional_mask, rng.random(count).round(3), 0.0
             )
-        }
+        else:
+            fractional_mask = np.zeros(count, dtype=bool)
 
-        return challenge
+        base_difference = np.abs(source_bases - target_bases)
+        complexities = np.minimum(
+            base_difference *
+            (1 + np.log(np.abs(values) + 1)) /
+            np.log(np.maximum(source_bases, target_bases)),
+            10.0
+        )
+
+        level_name = level.name
+        return [
+            Challenge(
+                int(source_bases[i]),
+                int(target_bases[i]),
+                float(values[i]) if fractional_mask[i] else int(values[i]),
+                level_name,
+                float(complexities[i])
+            )
+            for i in range(count)
+        ]
 
     def _calculate_challenge_complexity(
         self,
@@ -208,16 +388,35 @@ class AdaptiveLearningPathway:
         Returns:
             float: Cognitive complexity score
         """
-        base_difference = abs(source_base - target_base)
-        value_magnitude = abs(value)
+        return _complexity_kernel(source_base, target_base, float(value))
 
-        complexity = (
-            base_difference *
-            (1 + math.log(value_magnitude + 1)) /
-            math.log(max(source_base, target_base))
-        )
+    def evaluate_answer(self, challenge: Challenge, user_answer: str) -> Dict:
+        """
+        Evaluate a learner's answer to a generated challenge.
+
+        Args:
+            challenge (Challenge): Challenge the answer responds to
+            user_answer (str): Learner's answer, as entered
 
-        return min(complexity, 10.0)  # Cap complexity
+        Returns:
+            Dict: Evaluation with the challenge, the correct answer,
+            is_correct, and an error_rate of 0.0 or 1.0
+        """
+        from core.conversion_engine import convert_number
+
+        correct_answer = convert_number(
+            challenge.value,
+            challenge.source_base,
+            challenge.target_base
+        )
+        is_correct = str(user_answer) == str(correct_answer)
+        return {
+            'challenge': challenge,
+            'user_answer': user_answer,
+            'correct_answer': correct_answer,
+            'is_correct': is_correct,
+            'error_rate': 0.0 if is_correct else 1.0,
+        }
 
     def submit_challenge_result(self, result: Dict) -> None:
         """
@@ -234,7 +433,7 @@ class AdaptiveLearningPathway:
         # Update learning state based on performance
         self.learning_state.update_profile(result)
 
-@dataclass
+@dataclass(slots=True)
 class LearningPathway:
     name: str
     description: Optional[str] = None
@@ -243,9 +442,50 @@ class LearningPathway:
 class LearningPathways:
     DB_FILE = 'learning_pathways.db'
 
-    def __init__(self):
-        self.connection = sqlite3.connect(self.DB_FILE)
+    # Bound on the name -> pathway lookup cache; oldest entries are
+    # evicted first once full
+    _CACHE_CAPACITY = 1024
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Open (or create) the pathway store.
+
+        Args:
+            db_path (Optional[str]): Database location; defaults to
+                DB_FILE. Pass ':memory:' to avoid disk entirely, e.g.
+                in tests.
+        """
+        # Deferred imports: pathway storage is the only consumer, so
+        # importing this module for the learning types alone loads
+        # neither sqlite3 nor logging
+        global sqlite3, _logger
+        import sqlite3
+        import logging
+        if _logger is None:
+            if not logging.getLogger().handlers:
+                logging.basicConfig(
+                    level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s'
+                )
+            _logger = logging.getLogger(__name__)
+        self.connection = sqlite3.connect(db_path or self.DB_FILE)
+        # WAL avoids a journal rewrite per transaction and NORMAL skips
+        # the fsync-per-commit that dominates single-row writes
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('PRAGMA temp_store=MEMORY')
+        # Name-based row access without per-row tuple unpacking
+        self.connection.row_factory = sqlite3.Row
         self._create_table()
+        # Caches both hits and misses (None) so the existence checks done
+        # before every mutation skip the SQLite round-trip
+        self._cache: Dict[str, Optional[LearningPathway]] = {}
+
+    def _cache_store(self, name: str, pathway: Optional[LearningPathway]) -> None:
+        if len(self._cache) >= self._CACHE_CAPACITY and name not in self._cache:
+            # Evict in insertion order (oldest first)
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[name] = pathway
 
     def _create_table(self):
         with self.connection:
@@ -257,49 +497,77 @@ class LearningPathways:
             ''')
 
     def create_learning_pathway(self, name: str, description: Optional[str] = None):
-        if self.get_learning_pathway(name):
-            logging.error(f"A learning pathway named '{name}' already exists.")
-            print(f"Error: A learning pathway named '{name}' already exists.")
-            return False
-        try:
-            with self.connection:
-                self.connection.execute(
-                    'INSERT INTO pathways (name, description) VALUES (?, ?)',
-                    (name, description)
-                )
-            logging.info(f"Learning pathway '{name}' created.")
-            return True
-        except sqlite3.IntegrityError:
+        # INSERT OR IGNORE ... RETURNING (SQLite >= 3.35) folds the
+        # existence check and the insert into one statement: on a
+        # duplicate name nothing is inserted and nothing is returned
+        with self.connection:
+            row = self.connection.execute(
+                'INSERT OR IGNORE INTO pathways (name, description) VALUES (?, ?) RETURNING name',
+                (name, description)
+            ).fetchone()
+        if row is None:
+            _logger.error(f"A learning pathway named '{name}' already exists.")
             print(f"Error: A learning pathway named '{name}' already exists.")
             return False
+        self._cache_store(name, LearningPathway(name=name, description=description))
+        _logger.info(f"Learning pathway '{name}' created.")
+        return True
 
-    def get_learning_pathway(self, name: str) -> Optional[LearningPathway]:
+    def create_learning_pathways(self, items: List[tuple]) -> None:
+        """
+        Bulk-create pathways inside a single transaction.
+
+        Args:
+            items (List[tuple]): (name, description) pairs; names that
+                already exist are ignored
+        """
         with self.connection:
-            cursor = self.connection.cursor()
-            cursor.execute('SELECT name, description FROM pathways WHERE name = ?', (name,))
-            row = cursor.fetchone()
-            if row:
-                return LearningPathway(name=row[0], description=row[1])
-            return None
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO pathways (name, description) VALUES (?, ?)',
+                items
+            )
+        # Seeded names may shadow cached misses
+        for name, _description in items:
+            self._cache.pop(name, None)
+
+    def get_learning_pathway(self, name: str) -> Optional[LearningPathway]:
+        if name in self._cache:
+            return self._cache[name]
+        # Plain SELECT outside `with self.connection:` -- reads need no
+        # BEGIN/COMMIT pair
+        row = self.connection.execute(
+            'SELECT name, description FROM pathways WHERE name = ?', (name,)
+        ).fetchone()
+        pathway = LearningPathway(name=row['name'], description=row['description']) if row else None
+        self._cache_store(name, pathway)
+        return pathway
 
     def get_all_learning_pathways(self) -> List[LearningPathway]:
-        pathways = []
-        with self.connection:
-            cursor = self.connection.cursor()
-            cursor.execute('SELECT name, description FROM pathways')
-            rows = cursor.fetchall()
-            for row in rows:
-                pathways.append(LearningPathway(name=row[0], description=row[1]))
-        return pathways
+        # fetchall gives one tight C loop over the cursor; rows unpack
+        # positionally, skipping the per-row name lookups
+        rows = self.connection.execute(
+            'SELECT name, description FROM pathways'
+        ).fetchall()
+        return [LearningPathway(name, description) for name, description in rows]
+
+    def list_learning_pathways(self) -> List[str]:
+        """
+        Return the names of all pathways, in creation order.
+        """
+        rows = self.connection.execute('SELECT name FROM pathways').fetchall()
+        return [name for (name,) in rows]
 
     def edit_learning_pathway(self, name: str, new_name: Optional[str] = None, description: Optional[str] = None) -> bool:
         pathway = self.get_learning_pathway(name)
         if not pathway:
-            logging.warning(f"Attempted to edit non-existent pathway '{name}'.")
+            _logger.warning(f"Attempted to edit non-existent pathway '{name}'.")
             return False
 
         if new_name is None:
             new_name = pathway.name # Keep the old name if new_name is not provided
+        elif new_name != name and self._cache.get(new_name) is not None:
+            # Known-occupied target name: reject without touching SQLite
+            return False
 
         try:
             with self.connection:
@@ -307,7 +575,9 @@ class LearningPathways:
                     'UPDATE pathways SET name = ?, description = ? WHERE name = ?',
                     (new_name, description, name)
                 )
-            logging.info(f"Learning pathway '{name}' updated. Old name: '{name}', New name: '{new_name}'.")
+            self._cache.pop(name, None)
+            self._cache_store(new_name, LearningPathway(name=new_name, description=description))
+            _logger.info(f"Learning pathway '{name}' updated. Old name: '{name}', New name: '{new_name}'.")
             return True
         except sqlite3.IntegrityError: # In case new_name already exists (though primary key should prevent this)
             return False
@@ -315,11 +585,12 @@ class LearningPathways:
     def delete_learning_pathway(self, name: str) -> bool:
         pathway = self.get_learning_pathway(name)
         if not pathway:
-            logging.warning(f"Attempted to delete non-existent pathway '{name}'.")
+            _logger.warning(f"Attempted to delete non-existent pathway '{name}'.")
             return False
         with self.connection:
             cursor = self.connection.cursor()
             cursor.execute('DELETE FROM pathways WHERE name = ?', (name,))
+            self._cache_store(name, None)
             return cursor.rowcount > 0 # rowcount > 0 means something was deleted
-        logging.info(f"Learning pathway '{name}' deleted.")
+        _logger.info(f"Learning pathway '{name}' deleted.")
         return True